@@ -0,0 +1,150 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+    # Explicit signatures compile the kernel for both supported dtypes up
+    # front (served from the on-disk cache after the first build), matching
+    # the per-feature kernels in player_awareness / player_influence
+    _COMBINED_SIGNATURES = [
+        "void(float32[::1], float32[::1], float32[::1], float32[::1], float32[::1],"
+        " float32[::1], float32[::1], float32[::1], float32[::1], float32[::1],"
+        " float32, float32, float32, float32, float32, float32, float32,"
+        " float32[::1], float32[::1], float32[:, ::1], float32[:, ::1])",
+        "void(float64[::1], float64[::1], float64[::1], float64[::1], float64[::1],"
+        " float64[::1], float64[::1], float64[::1], float64[::1], float64[::1],"
+        " float64, float64, float64, float64, float64, float64, float64,"
+        " float64[::1], float64[::1], float64[:, ::1], float64[:, ::1])",
+    ]
+
+    @njit(_COMBINED_SIGNATURES, parallel=True, fastmath=True, cache=True)
+    def _combined_kernel(x, y, a_ux, a_uy, dir_ux, dir_uy, o_ux, o_uy, a_s, i_s,
+                         cos_half_fov, a_alpha, a_beta, a_max_distance,
+                         i_alpha, i_beta, i_max_distance,
+                         t_x, t_y, awareness_out, influence_out):
+        """
+        Fused awareness + influence kernel: one pass over every player-target
+        pair, writing both feature matrices.
+
+        dx, dy and the distance are computed once per cell and shared between
+        the two features, halving the geometry work and memory traffic of
+        running the per-feature kernels back to back. The betas differ by
+        default (0.04 vs 0.075), so each feature still takes its own exp.
+        """
+        n_players = x.shape[0]
+        n_targets = t_x.shape[0]
+        for i in prange(n_players):
+            for j in range(n_targets):
+                dx = t_x[j] - x[i]
+                dy = t_y[j] - y[i]
+                distance = math.sqrt(dx * dx + dy * dy)
+
+                # Awareness (see player_awareness._awareness_kernel)
+                if distance > a_max_distance:
+                    awareness_out[i, j] = 0.0
+                else:
+                    if distance > 0:
+                        cos_offset = (a_ux[i] * dx + a_uy[i] * dy) / distance
+                    else:
+                        cos_offset = a_ux[i]
+                    if cos_offset < cos_half_fov:
+                        awareness_out[i, j] = 0.0
+                    else:
+                        awareness = (1 + a_alpha * a_s[i]) * math.exp(-a_beta * distance) * cos_offset
+                        awareness_out[i, j] = awareness if awareness > 0 else 0.0
+
+                # Influence (see player_influence._influence_kernel)
+                if distance > i_max_distance:
+                    influence_out[i, j] = 0.0
+                else:
+                    if distance > 0:
+                        cos_dir = (dir_ux[i] * dx + dir_uy[i] * dy) / distance
+                        cos_o = (o_ux[i] * dx + o_uy[i] * dy) / distance
+                    else:
+                        cos_dir = dir_ux[i]
+                        cos_o = o_ux[i]
+                    influence_out[i, j] = (
+                        (2 + 0.7 * cos_dir + 0.3 * cos_o)
+                        * (1 + i_alpha * i_s[i])
+                        * math.exp(-i_beta * distance)
+                    )
+
+
+def calculate_awareness_and_influence_batch(awareness_calculator, influence_calculator,
+                                            positions, awareness_attributes,
+                                            influence_attributes, targets, degrees=True,
+                                            awareness_out=None, influence_out=None):
+    """
+    Compute awareness and influence for the same player-target grid in one pass.
+
+    Callers that need both features per frame should use this instead of two
+    separate batch calls: the pair geometry (dx, dy, distance) dominates the
+    per-cell work and is computed once here instead of twice. The fusion
+    needs the numba kernel; without numba (or on device='cuda', where each
+    calculator manages its own transfers) this dispatches to the two
+    per-feature batch calls unchanged.
+
+    Args:
+        awareness_calculator (PlayerAwarenessCalculator): Configured awareness calculator.
+        influence_calculator (PlayerInfluenceCalculator): Configured influence
+            calculator of the same dtype.
+        positions (np.ndarray): Array of shape (N, 2) containing player positions [x, y].
+        awareness_attributes (np.ndarray): Array of shape (N, 2) with [o, s].
+        influence_attributes (np.ndarray): Array of shape (N, 3) with [dir, o, s].
+        targets (np.ndarray): Array of shape (M, 2) containing target positions.
+        degrees (bool): Whether the angle columns are in degrees.
+        awareness_out, influence_out (np.ndarray): Optional preallocated
+            (N, M) output arrays.
+
+    Returns:
+        tuple of np.ndarray: (awareness, influence), each of shape (N, M).
+    """
+    if awareness_calculator.dtype != influence_calculator.dtype:
+        raise ValueError("awareness and influence calculators must share a dtype, "
+                         f"got {awareness_calculator.dtype} and {influence_calculator.dtype}")
+
+    if (not _NUMBA_AVAILABLE or awareness_calculator.device == "cuda"
+            or influence_calculator.device == "cuda"):
+        awareness = awareness_calculator.calculate_awareness_batch(
+            positions, awareness_attributes, targets, degrees=degrees, out=awareness_out)
+        influence = influence_calculator.calculate_influence_batch(
+            positions, influence_attributes, targets, degrees=degrees, out=influence_out)
+        return awareness, influence
+
+    dtype = awareness_calculator.dtype
+    x = np.ascontiguousarray(positions[:, 0], dtype=dtype)
+    y = np.ascontiguousarray(positions[:, 1], dtype=dtype)
+    a_o_rad = np.ascontiguousarray(awareness_attributes[:, 0], dtype=dtype)
+    dir_rad = np.ascontiguousarray(influence_attributes[:, 0], dtype=dtype)
+    i_o_rad = np.ascontiguousarray(influence_attributes[:, 1], dtype=dtype)
+    if degrees:
+        a_o_rad = np.radians(a_o_rad)
+        dir_rad = np.radians(dir_rad)
+        i_o_rad = np.radians(i_o_rad)
+    a_s = np.ascontiguousarray(awareness_attributes[:, 1], dtype=dtype)
+    i_s = np.ascontiguousarray(influence_attributes[:, 2], dtype=dtype)
+    t_x = np.ascontiguousarray(targets[:, 0], dtype=dtype)
+    t_y = np.ascontiguousarray(targets[:, 1], dtype=dtype)
+
+    if awareness_out is None:
+        awareness_out = np.empty((len(x), len(t_x)), dtype=dtype)  # Shape (N, M)
+    if influence_out is None:
+        influence_out = np.empty((len(x), len(t_x)), dtype=dtype)  # Shape (N, M)
+
+    _combined_kernel(x, y, np.sin(a_o_rad), np.cos(a_o_rad),
+                     np.sin(dir_rad), np.cos(dir_rad),
+                     np.sin(i_o_rad), np.cos(i_o_rad), a_s, i_s,
+                     awareness_calculator._cos_half_fov,
+                     awareness_calculator.alpha, awareness_calculator.beta,
+                     awareness_calculator._max_distance,
+                     influence_calculator.alpha, influence_calculator.beta,
+                     influence_calculator._max_distance,
+                     t_x, t_y, awareness_out, influence_out)
+    return awareness_out, influence_out
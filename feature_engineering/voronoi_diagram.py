@@ -1,14 +1,104 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from scipy.spatial import Voronoi, voronoi_plot_2d
-from shapely.geometry import Polygon
+from scipy.spatial import QhullError, Voronoi, voronoi_plot_2d
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _shoelace_csr(vertices, region_ptr, region_idx, out):
+        """
+        Shoelace areas for a batch of polygons stored CSR-style.
+
+        Region i spans region_idx[region_ptr[i]:region_ptr[i + 1]], indexing
+        rows of `vertices`. Empty spans (unbounded/degenerate regions) get
+        area 0. Avoids per-region Python/Shapely object allocation.
+        """
+        for i in prange(region_ptr.shape[0] - 1):
+            start = region_ptr[i]
+            end = region_ptr[i + 1]
+            if end - start < 3:
+                out[i] = 0.0
+                continue
+            area = 0.0
+            x_prev = vertices[region_idx[end - 1], 0]
+            y_prev = vertices[region_idx[end - 1], 1]
+            for k in range(start, end):
+                x = vertices[region_idx[k], 0]
+                y = vertices[region_idx[k], 1]
+                area += x_prev * y - x * y_prev
+                x_prev = x
+                y_prev = y
+            out[i] = 0.5 * abs(area)
+
+
+def _clip_halfplane(polygon, axis, value, keep_greater):
+    """
+    Clip a polygon against a single axis-aligned half-plane.
+
+    Written against a preallocated output buffer (a clipped convex polygon
+    gains at most one vertex per edge) so the loop JIT-compiles: when numba
+    is installed this function is njit-compiled below, removing the
+    per-vertex Python interpreter and ndarray-indexing overhead.
+
+    Args:
+        polygon (np.ndarray): Array of shape (K, 2) of polygon vertices.
+        axis (int): 0 to clip on x, 1 to clip on y.
+        value (float): Coordinate of the clipping line.
+        keep_greater (bool): Keep the side with coordinate >= value if True,
+            <= value otherwise.
+
+    Returns:
+        np.ndarray: Vertices of the clipped polygon (possibly empty).
+    """
+    n_vertices = polygon.shape[0]
+    if n_vertices == 0:
+        return polygon
+
+    clipped = np.empty((2 * n_vertices, 2))
+    n_clipped = 0
+    for k in range(n_vertices):
+        k_next = k + 1 if k + 1 < n_vertices else 0
+        c0 = polygon[k, axis]
+        c1 = polygon[k_next, axis]
+        inside_0 = c0 >= value if keep_greater else c0 <= value
+        inside_1 = c1 >= value if keep_greater else c1 <= value
+        if inside_0:
+            clipped[n_clipped, 0] = polygon[k, 0]
+            clipped[n_clipped, 1] = polygon[k, 1]
+            n_clipped += 1
+        if inside_0 != inside_1:
+            # Edge crosses the clipping line: emit the intersection point
+            t = (value - c0) / (c1 - c0)
+            clipped[n_clipped, 0] = polygon[k, 0] + t * (polygon[k_next, 0] - polygon[k, 0])
+            clipped[n_clipped, 1] = polygon[k, 1] + t * (polygon[k_next, 1] - polygon[k, 1])
+            n_clipped += 1
+
+    return clipped[:n_clipped]
+
+
+if _NUMBA_AVAILABLE:
+    _clip_halfplane = njit(cache=True)(_clip_halfplane)
 
 
 class VoronoiDiagram:
     def __init__(self, bounding_box=(0, 120, 0, 53.3)):
         self.bounding_box = bounding_box
         self.vor = None
+        self._last_points = None  # Cache for compute_voronoi_areas_delta
+        self._last_areas = None
+
+        # Warm up the JIT so the first real call doesn't pay compilation cost
+        if _NUMBA_AVAILABLE:
+            _shoelace_csr(np.zeros((1, 2)), np.zeros(2, dtype=np.int64),
+                          np.zeros(1, dtype=np.int64), np.empty(1))
+            _clip_halfplane(np.zeros((3, 2)), 0, 0.0, True)
 
     def compute_voronoi_areas(self, points):
         # Filter points inside bounding box
@@ -16,30 +106,210 @@ class VoronoiDiagram:
         in_box = (points[:, 0] >= x_min) & (points[:, 0] <= x_max) & (points[:, 1] >= y_min) & (points[:, 1] <= y_max)
         filtered_points = points[in_box]
 
-        # Add mirrored points for bounded Voronoi
+        # Coincident sites (possible in tracking data rounded to 0.01 yd)
+        # make Qhull's treatment of the twins arbitrary; deduplicate before
+        # the diagram and give every twin the surviving site's area — the
+        # full shared cell, as the mirrored baseline did
+        sites, inverse = np.unique(filtered_points, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+
+        # Compute Voronoi on the raw sites: no mirroring, so Qhull sees N
+        # points instead of 5N ("Qbb Qc Qz" speeds it on near-coplanar
+        # inputs). Frames Qhull cannot triangulate directly — fewer than 4
+        # sites, or all-collinear sites that flatten the initial simplex —
+        # fall back to the mirrored construction
+        site_areas = None
+        if len(sites) >= 4:
+            try:
+                self.vor = Voronoi(sites, qhull_options="Qbb Qc Qz")
+                # Reconstruct unbounded regions as finite polygons and clip
+                # every region to the bounding box, then take Shoelace areas
+                polygons = [self._clip_polygon_to_box(polygon)
+                            for polygon in self._finite_polygons()]
+                site_areas = self._shoelace_areas(polygons)
+                # The clipped regions must tile the box exactly. Near-
+                # degenerate frames (almost-collinear sites, within
+                # tracking-data noise) can pass Qhull yet put finite vertices
+                # far beyond the far-point radius, silently corrupting the
+                # reconstruction — catch them here
+                if not np.isclose(site_areas.sum(),
+                                  (x_max - x_min) * (y_max - y_min), rtol=1e-6):
+                    site_areas = None
+            except QhullError:
+                site_areas = None
+        if site_areas is None:
+            site_areas = self._shoelace_areas(self._mirrored_polygons(sites))
+
+        areas = np.zeros(len(points))
+        areas[np.where(in_box)[0]] = site_areas[inverse]
+        return areas
+
+    def _shoelace_areas(self, polygons):
+        """
+        Shoelace areas of a list of (K, 2) polygons; degenerate polygons
+        (fewer than 3 vertices) get area 0.
+
+        Returns:
+            np.ndarray: Array of shape (len(polygons),) of areas.
+        """
+        n_regions = len(polygons)
+        if _NUMBA_AVAILABLE:
+            # Flatten the polygons into CSR arrays and compute all areas in
+            # one parallel kernel call; degenerate polygons get an empty span
+            region_ptr = np.zeros(n_regions + 1, dtype=np.int64)
+            np.cumsum([len(polygon) for polygon in polygons], out=region_ptr[1:])
+            vertices = (np.concatenate(polygons) if region_ptr[-1] > 0
+                        else np.empty((0, 2)))
+            out = np.empty(n_regions)
+            _shoelace_csr(vertices, region_ptr,
+                          np.arange(region_ptr[-1], dtype=np.int64), out)
+            return out
+
+        out = np.zeros(n_regions)
+        for i, polygon in enumerate(polygons):
+            if len(polygon) < 3:
+                continue
+            vx, vy = polygon[:, 0], polygon[:, 1]
+            out[i] = 0.5 * abs(np.dot(vx, np.roll(vy, -1)) - np.dot(vy, np.roll(vx, -1)))
+        return out
+
+    def compute_voronoi_areas_delta(self, points, tol=0.2):
+        """
+        Frame-to-frame cached variant of `compute_voronoi_areas`.
+
+        Adjacent tracking frames at 10 Hz move each player well under a yard,
+        so region areas change slowly; if no point has moved more than `tol`
+        yards since the last full computation, the cached areas are returned
+        and the Qhull call is skipped entirely. Intended for callers walking
+        a play frame by frame.
+
+        Args:
+            points (np.ndarray): Array of shape (N, 2) of player positions.
+            tol (float): Maximum per-coordinate displacement in yards below
+                which the previous frame's areas are reused.
+
+        Returns:
+            np.ndarray: Array of shape (N,) of Voronoi region areas.
+        """
+        if (self._last_points is not None
+                and points.shape == self._last_points.shape
+                and np.max(np.abs(points - self._last_points)) < tol):
+            return self._last_areas.copy()
+
+        areas = self.compute_voronoi_areas(points)
+        self._last_points = np.array(points, dtype=float)
+        self._last_areas = areas.copy()
+        return areas
+
+    def _mirrored_polygons(self, filtered_points):
+        """
+        Bounded Voronoi regions via the mirrored construction.
+
+        Fallback for degenerate frames the unmirrored fast path cannot
+        handle: reflecting the sites across all four box edges makes every
+        real site's region finite and bounded by the box, at 5x the Qhull
+        cost. Only reached for fewer than 4 in-box points, collinear inputs,
+        or near-degenerate frames that fail the tile-the-box area check, so
+        the cost never matters in practice.
+
+        Args:
+            filtered_points (np.ndarray): Array of shape (K, 2) of in-box sites.
+
+        Returns:
+            list of np.ndarray: One clipped (K, 2) vertex array per site.
+        """
+        x_min, x_max, y_min, y_max = self.bounding_box
         mirrored = np.vstack([
-            filtered_points, 
+            filtered_points,
             np.c_[2 * x_min - filtered_points[:, 0], filtered_points[:, 1]],
             np.c_[2 * x_max - filtered_points[:, 0], filtered_points[:, 1]],
             np.c_[filtered_points[:, 0], 2 * y_min - filtered_points[:, 1]],
             np.c_[filtered_points[:, 0], 2 * y_max - filtered_points[:, 1]]
         ])
-
-        # Compute Voronoi
         self.vor = Voronoi(mirrored)
-        box_polygon = Polygon([(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)])
 
-        # Calculate areas
-        areas = np.zeros(len(points))
-        for i, region_index in enumerate(self.vor.point_region[:len(filtered_points)]):
+        polygons = []
+        for region_index in self.vor.point_region[:len(filtered_points)]:
             region = self.vor.regions[region_index]
-            if -1 in region or not region:
+            if not region or -1 in region:
+                polygons.append(np.empty((0, 2)))
                 continue
-            poly = Polygon(self.vor.vertices[region])
-            clipped = poly.intersection(box_polygon)
-            areas[np.where(in_box)[0][i]] = clipped.area if not clipped.is_empty else 0
+            polygons.append(self._clip_polygon_to_box(self.vor.vertices[region]))
+        return polygons
 
-        return areas
+    def _finite_polygons(self):
+        """
+        Reconstruct the Voronoi regions of `self.vor` as finite polygons.
+
+        Bounded regions are returned as-is. For unbounded regions, each
+        infinite ridge is extended from its known endpoint along the ridge's
+        outward perpendicular-bisector direction to a point far beyond the
+        bounding box, and the vertices are re-sorted counter-clockwise.
+
+        Returns:
+            list of np.ndarray: One (K, 2) vertex array per input point.
+        """
+        vor = self.vor
+        x_min, x_max, y_min, y_max = self.bounding_box
+        center = vor.points.mean(axis=0)
+        # Far enough that every extended ridge exits the box and chords
+        # between far points stay outside it
+        radius = 100 * max(x_max - x_min, y_max - y_min)
+
+        # Map each point to its ridges: (other_point, vertex_1, vertex_2)
+        point_ridges = {}
+        for (p1, p2), (v1, v2) in zip(vor.ridge_points, vor.ridge_vertices):
+            point_ridges.setdefault(p1, []).append((p2, v1, v2))
+            point_ridges.setdefault(p2, []).append((p1, v1, v2))
+
+        polygons = []
+        for p1, region_index in enumerate(vor.point_region):
+            region = vor.regions[region_index]
+            if region and -1 not in region:
+                polygons.append(vor.vertices[region])
+                continue
+
+            # Unbounded region: keep the finite vertices and add a far point
+            # for each infinite ridge
+            finite = [vor.vertices[v] for v in region if v >= 0]
+            for p2, v1, v2 in point_ridges.get(p1, []):
+                if v2 < 0:
+                    v1, v2 = v2, v1
+                if v1 >= 0:
+                    continue  # bounded ridge
+                tangent = vor.points[p2] - vor.points[p1]
+                tangent = tangent / np.linalg.norm(tangent)
+                normal = np.array([-tangent[1], tangent[0]])
+                midpoint = (vor.points[p1] + vor.points[p2]) / 2
+                direction = np.sign(np.dot(midpoint - center, normal)) * normal
+                finite.append(vor.vertices[v2] + direction * radius)
+
+            polygon = np.asarray(finite)
+            if len(polygon) < 3:
+                polygons.append(polygon)
+                continue
+            # Sort counter-clockwise around the centroid
+            centroid = polygon.mean(axis=0)
+            angles = np.arctan2(polygon[:, 1] - centroid[1], polygon[:, 0] - centroid[0])
+            polygons.append(polygon[np.argsort(angles)])
+
+        return polygons
+
+    def _clip_polygon_to_box(self, polygon):
+        """
+        Clip a polygon to the bounding box (Sutherland-Hodgman).
+
+        Args:
+            polygon (np.ndarray): Array of shape (K, 2) of polygon vertices.
+
+        Returns:
+            np.ndarray: Vertices of the clipped polygon (possibly empty).
+        """
+        x_min, x_max, y_min, y_max = self.bounding_box
+        for axis, value, keep_greater in ((0, x_min, True), (0, x_max, False),
+                                          (1, y_min, True), (1, y_max, False)):
+            polygon = _clip_halfplane(polygon, axis, value, keep_greater)
+        return polygon
 
     def plot_voronoi(self):
         """